@@ -1245,9 +1245,8 @@ class Circuit:
 
         # identify boundaries
         qubits = targets + controls
-        qubits.sort()
-        min_qubits_id = qubits[0]
-        max_qubits_id = qubits[-1]
+        min_qubits_id = min(qubits)
+        max_qubits_id = max(qubits)
 
         # identify column
         col = idx[targets[0]] if not controls and len(targets) == 1 else max(idx)
@@ -1257,10 +1256,11 @@ class Circuit:
             matrix[iq].extend((1 + col - len(matrix[iq])) * [""])
 
         # fill
+        target_set, control_set = set(targets), set(controls)
         for iq in range(min_qubits_id, max_qubits_id + 1):
-            if iq in targets:
+            if iq in target_set:
                 matrix[iq][col] = gate_symbol
-            elif iq in controls:
+            elif iq in control_set:
                 matrix[iq][col] = "o"
             else:
                 matrix[iq][col] = "|"
@@ -1309,15 +1309,11 @@ class Circuit:
 
         # Print to terminal
         max_name_len = max(len(name) for name in self.wire_names)
-        output = ""
-        for q in range(self.nqubits):
-            output += (
-                self.wire_names[q]
-                + " " * (max_name_len - len(self.wire_names[q]))
-                + ": ─"
-                + "".join(matrix[q])
-                + "\n"
-            )
+        padded_names = [name.ljust(max_name_len) for name in self.wire_names]
+        output = "".join(
+            padded_names[q] + ": ─" + "".join(matrix[q]) + "\n"
+            for q in range(self.nqubits)
+        )
 
         # legend
         if legend:
@@ -1351,20 +1347,16 @@ class Circuit:
                 if nchunks == 1:
                     loutput = None
                     break
+                row_prefix = padded_names[row] + ": "
                 for i, c in enumerate(chunks):
                     loutput += ["" for _ in range(self.nqubits)]
                     suffix = " ...\n"
-                    prefix = (
-                        self.wire_names[row]
-                        + " " * (max_name_len - len(self.wire_names[row]))
-                        + ": "
-                    )
                     if i == 0:
-                        prefix += " " * 4
+                        prefix = row_prefix + " " * 4
                     elif row == 0:
-                        prefix = "\n" + prefix + "... "
+                        prefix = "\n" + row_prefix + "... "
                     else:
-                        prefix += "... "
+                        prefix = row_prefix + "... "
                     if i == nchunks - 1:
                         suffix = "\n"
                     loutput[row + i * self.nqubits] = prefix + c + suffix